@@ -4,14 +4,14 @@ Telegram bot handlers for interview process
 
 import time
 import logging
-import json
+import orjson
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
 from database import clear_database, get_cursor, get_connection
 from app.questions import get_random_questions, QUESTIONS_PER_INTERVIEW
 from app.scoring import analyze_response, determine_decision
-from app.utils import generate_feedback, notify_admin
+from app.utils import collect_admin_report, generate_feedback, notify_admin
 
 logger = logging.getLogger(__name__)
 
@@ -20,20 +20,87 @@ PURGE_CANCEL_CALLBACK = "admin_purge_cancel"
 
 ABANDONMENT_THRESHOLD_SECONDS = 30 * 60
 
+# Reply templates, built once at import instead of on every /start
+_WELCOME_TEMPLATE = (
+    "Hello! 👋\n\n"
+    "We're happy to see you're interested in becoming part of our team.\n\n"
+    "We'll now proceed with the interview phase. This consists of {count} short questions designed to understand "
+    "how you communicate, handle different fan situations, and whether your style aligns with what we're looking for.\n\n"
+    "There are no trick questions. Just be yourself and answer naturally."
+)
+_ADMIN_TEST_PREFIX = "🛠️ Admin Test Mode\n\n"
+_ADMIN_FEEDBACK_SUFFIX = "\n\n🛠️ Admin Test Mode: You can retake this interview anytime using /start"
+_START_ADMIN_RESTART_COMPLETED = (
+    "🛠️ Admin Test Mode: Restarting interview for testing.\n\n"
+    "You can retake the interview as many times as needed for testing purposes."
+)
+_START_ADMIN_RESTART_IN_PROGRESS = (
+    "🛠️ Admin Test Mode: Restarting interview (previous interview was in progress).\n\n"
+    "You can retake the interview as many times as needed for testing purposes."
+)
+
+# bot.ADMIN_IDS, resolved lazily by _load_admin_ids()
+_ADMIN_IDS_FROZEN = None
+
+# Hot-path statements, kept as constants so sqlite3's statement cache reuses them.
+# Rows come back as sqlite3.Row (see init_database) and are read by column name.
+_START_ROW_SQL = """
+    SELECT has_completed_interview, decision, feedback, question_index, selected_questions
+    FROM candidates WHERE user_id = ?
+"""
+# Fresh-interview reset as one UPSERT: first /start inserts, later ones overwrite
+# in place (name is left as it was)
+_RESET_CANDIDATE_SQL = """
+    INSERT INTO candidates
+    (user_id, username, question_index, last_time, completed, score, ai_score, decision, feedback,
+     has_completed_interview, selected_questions, abandoned_alerted)
+    VALUES (?, ?, 1, ?, 0, 0, 0, NULL, NULL, 0, ?, 0)
+    ON CONFLICT(user_id) DO UPDATE SET
+        username = excluded.username, question_index = 1, last_time = excluded.last_time,
+        completed = 0, score = 0, ai_score = 0, decision = NULL, feedback = NULL,
+        has_completed_interview = 0, selected_questions = excluded.selected_questions,
+        abandoned_alerted = 0
+"""
+_SELECTED_QUESTIONS_SQL = "SELECT selected_questions FROM candidates WHERE user_id = ?"
+_ANSWER_STATE_SQL = """
+    SELECT question_index, last_time, has_completed_interview, score
+    FROM candidates WHERE user_id = ?
+"""
+_INSERT_RESPONSE_SQL = """
+    INSERT INTO responses (user_id, question_number, question_text, response_text, response_time, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_FINAL_STATE_SQL = """
+    SELECT has_completed_interview, score, ai_score, username, name
+    FROM candidates WHERE user_id = ?
+"""
+# Candidate updates: admins bypass the completion guard via the second bind,
+# so each update is one statement instead of an admin/non-admin pair
+_ADVANCE_ANSWER_SQL = """
+    UPDATE candidates
+    SET score = score + ?, ai_score = ai_score + ?, question_index = question_index + 1, last_time = ?
+    WHERE user_id = ? AND (? = 1 OR has_completed_interview = 0)
+"""
+_COMPLETE_INTERVIEW_SQL = """
+    UPDATE candidates
+    SET completed = 1, has_completed_interview = 1, decision = ?, feedback = ?, last_time = ?
+    WHERE user_id = ? AND (? = 1 OR has_completed_interview = 0)
+"""
+
 
 async def check_abandoned_interviews(context: ContextTypes.DEFAULT_TYPE):
     """Periodic JobQueue callback: alert admin about candidates who started
     an interview, went silent for ABANDONMENT_THRESHOLD_SECONDS, and never
     finished. Each candidate is alerted once."""
     try:
-        import bot as bot_module
-        admin_ids = getattr(bot_module, 'ADMIN_IDS', [])
+        admin_ids = _load_admin_ids()
         if not admin_ids:
             return
 
         cur = get_cursor()
         conn = get_connection()
-        cutoff = time.time() - ABANDONMENT_THRESHOLD_SECONDS
+        now = time.time()
+        cutoff = now - ABANDONMENT_THRESHOLD_SECONDS
 
         cur.execute(
             """
@@ -53,11 +120,11 @@ async def check_abandoned_interviews(context: ContextTypes.DEFAULT_TYPE):
 
         for user_id, username, name, qindex, last_time, sel_q in rows:
             try:
-                total = len(json.loads(sel_q)) if sel_q else QUESTIONS_PER_INTERVIEW
-            except (json.JSONDecodeError, TypeError):
+                total = len(orjson.loads(sel_q)) if sel_q else QUESTIONS_PER_INTERVIEW
+            except (orjson.JSONDecodeError, TypeError):
                 total = QUESTIONS_PER_INTERVIEW
             answered = max(0, qindex - 1)
-            mins_idle = int((time.time() - last_time) / 60)
+            mins_idle = int((now - last_time) / 60)
             display = name if name else (f"@{username}" if username else f"User {user_id}")
 
             alert = (
@@ -73,16 +140,18 @@ async def check_abandoned_interviews(context: ContextTypes.DEFAULT_TYPE):
                 try:
                     await context.bot.send_message(chat_id=admin, text=alert)
                 except Exception as e:
-                    logger.error(f"Failed to send abandonment alert to admin {admin}: {e}")
+                    logger.error("Failed to send abandonment alert to admin %s: %s", admin, e)
 
+            # Commit before the next send: handlers share this connection and
+            # must not find (or roll back) the flag pending across an await
             cur.execute(
                 "UPDATE candidates SET abandoned_alerted = 1 WHERE user_id = ?",
                 (user_id,),
             )
-        conn.commit()
-        logger.info(f"Abandonment alerts sent for {len(rows)} candidate(s)")
+            conn.commit()
+        logger.info("Abandonment alerts sent for %s candidate(s)", len(rows))
     except Exception as e:
-        logger.exception(f"check_abandoned_interviews crashed: {e}")
+        logger.exception("check_abandoned_interviews crashed: %s", e)
 
 
 def _build_replies_text(cur, user_id: int) -> str:
@@ -98,37 +167,56 @@ def _build_replies_text(cur, user_id: int) -> str:
     return "\n\n".join(parts) if parts else ""
 
 
-def is_admin(user_id: int) -> bool:
-    """Check if a user is an admin."""
-    try:
+def _load_admin_ids() -> frozenset:
+    """Resolve bot.ADMIN_IDS into a frozenset once and reuse it afterwards."""
+    global _ADMIN_IDS_FROZEN
+    if _ADMIN_IDS_FROZEN is None:
         import sys
         if 'bot' in sys.modules:
             bot_module = sys.modules['bot']
-            admin_ids = getattr(bot_module, 'ADMIN_IDS', [])
         else:
-            import bot
-            admin_ids = getattr(bot, 'ADMIN_IDS', [])
-        result = user_id in admin_ids
-        logger.info(f"Admin check for user {user_id}: ADMIN_IDS={admin_ids}, is_admin={result}")
-        return result
-    except (ImportError, AttributeError, Exception) as e:
-        logger.error(f"Failed to get ADMIN_IDS for user {user_id}: {e}, defaulting to False", exc_info=True)
-        return False
+            import bot as bot_module
+        _ADMIN_IDS_FROZEN = frozenset(getattr(bot_module, 'ADMIN_IDS', ()))
+    return _ADMIN_IDS_FROZEN
 
 
-def get_user_questions(cur, user_id: int) -> list[str]:
-    """Get the selected questions for a user from the database."""
-    cur.execute("SELECT selected_questions FROM candidates WHERE user_id=?", (user_id,))
-    result = cur.fetchone()
-    if result and result[0]:
+def is_admin(user_id: int) -> bool:
+    """Check if a user is an admin."""
+    # Once resolved this is a single set probe; no admins configured means no probe at all
+    ids = _ADMIN_IDS_FROZEN
+    if ids is None:
         try:
-            return json.loads(result[0])
-        except (json.JSONDecodeError, TypeError):
-            logger.error(f"Failed to parse questions for user {user_id}")
+            ids = _load_admin_ids()
+        except Exception as e:
+            logger.error("Failed to get ADMIN_IDS for user %s: %s, defaulting to False", user_id, e, exc_info=True)
+            return False
+    return bool(ids) and user_id in ids
+
+
+def _parse_questions(raw, user_id: int) -> list[str]:
+    """Decode a stored selected_questions value, or None if missing/corrupt."""
+    if raw:
+        try:
+            return orjson.loads(raw)
+        except (orjson.JSONDecodeError, TypeError):
+            logger.error("Failed to parse questions for user %s", user_id)
             return None
     return None
 
 
+def get_user_questions(cur, user_id: int) -> list[str]:
+    """Get the selected questions for a user from the database."""
+    cur.execute(_SELECTED_QUESTIONS_SQL, (user_id,))
+    result = cur.fetchone()
+    return _parse_questions(result["selected_questions"], user_id) if result else None
+
+
+def _fetch_start_row(cur, user_id: int):
+    """Fetch every candidate field start_handler branches on, in one query."""
+    cur.execute(_START_ROW_SQL, (user_id,))
+    return cur.fetchone()
+
+
 async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command - initialize interview."""
     try:
@@ -136,7 +224,7 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         cur = get_cursor()
         conn = get_connection()
 
-        logger.info(f"User {user.id} (@{user.username}) started the bot")
+        logger.info("User %s (@%s) started the bot", user.id, user.username)
 
         is_admin_user = is_admin(user.id)
 
@@ -149,19 +237,19 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 "2. Set a public @username\n"
                 "3. Send /start again to begin the interview."
             )
-            logger.warning(f"User {user.id} has no Telegram username — aborted /start")
+            logger.warning("User %s has no Telegram username — aborted /start", user.id)
             return
         if is_admin_user:
-            logger.info(f"Admin user {user.id} starting test interview - bypassing completion lock")
+            logger.info("Admin user %s starting test interview - bypassing completion lock", user.id)
 
-        # Check if interview already completed (unless admin)
-        cur.execute("SELECT has_completed_interview, decision, feedback FROM candidates WHERE user_id=?", (user.id,))
-        existing = cur.fetchone()
+        # One fetch for the completion and in-progress checks below
+        existing = _fetch_start_row(cur, user.id)
 
-        if existing and existing[0] == 1 and not is_admin_user:
-            has_completed, decision, stored_feedback = existing
-            decision = decision or "N/A"
-            logger.warning(f"User {user.id} attempted /start after completion - BLOCKED (Decision: {decision})")
+        # Check if interview already completed (unless admin)
+        if existing and existing["has_completed_interview"] == 1 and not is_admin_user:
+            decision = existing["decision"] or "N/A"
+            stored_feedback = existing["feedback"]
+            logger.warning("User %s attempted /start after completion - BLOCKED (Decision: %s)", user.id, decision)
             if decision == "APPROVED":
                 await update.message.reply_text(
                     "You have already completed the interview and were accepted.\n\n"
@@ -177,82 +265,50 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                         "We appreciate your interest, but we've decided to move forward with other candidates at this time."
                     )
             return
-        elif existing and existing[0] == 1 and is_admin_user:
-            logger.info(f"Admin {user.id} restarting interview for testing purposes")
-            await update.message.reply_text(
-                "🛠️ Admin Test Mode: Restarting interview for testing.\n\n"
-                "You can retake the interview as many times as needed for testing purposes."
-            )
+        elif existing and existing["has_completed_interview"] == 1 and is_admin_user:
+            logger.info("Admin %s restarting interview for testing purposes", user.id)
+            await update.message.reply_text(_START_ADMIN_RESTART_COMPLETED)
 
         # Check if interview in progress
-        cur.execute("SELECT question_index, has_completed_interview FROM candidates WHERE user_id=?", (user.id,))
-        row = cur.fetchone()
-
-        if row and row[1] == 0 and not is_admin_user:
-            current_index, _ = row
-            user_questions = get_user_questions(cur, user.id)
+        if existing and existing["has_completed_interview"] == 0 and not is_admin_user:
+            current_index = existing["question_index"]
+            user_questions = _parse_questions(existing["selected_questions"], user.id)
             if user_questions and 1 <= current_index <= len(user_questions):
                 await update.message.reply_text(
                     f"You already have an interview in progress.\n\n"
                     f"You're on question {current_index} of {len(user_questions)}.\n"
                     f"Please continue by answering the current question."
                 )
-                logger.info(f"User {user.id} tried to restart while interview in progress (question {current_index})")
+                logger.info("User %s tried to restart while interview in progress (question %s)", user.id, current_index)
                 return
-        elif row and row[1] == 0 and is_admin_user:
-            logger.info(f"Admin {user.id} restarting interview that was in progress")
-            await update.message.reply_text(
-                "🛠️ Admin Test Mode: Restarting interview (previous interview was in progress).\n\n"
-                "You can retake the interview as many times as needed for testing purposes."
-            )
-
-        # Fresh start
-        cur.execute("SELECT has_completed_interview FROM candidates WHERE user_id=?", (user.id,))
-        check_completed = cur.fetchone()
-
-        if check_completed and check_completed[0] == 1 and not is_admin_user:
-            logger.error(f"CRITICAL: Attempted fresh start for user {user.id} but has_completed_interview=1!")
-            await update.message.reply_text(
-                "You have already completed the interview. Please contact an administrator if you believe this is an error."
-            )
-            return
+        elif existing and existing["has_completed_interview"] == 0 and is_admin_user:
+            logger.info("Admin %s restarting interview that was in progress", user.id)
+            await update.message.reply_text(_START_ADMIN_RESTART_IN_PROGRESS)
 
-        cur.execute("DELETE FROM responses WHERE user_id = ?", (user.id,))
-        conn.commit()
-        logger.info(f"[START] Deleted all old responses for user {user.id}")
+        # Fresh start; first-time candidates have no candidates row, hence no responses to wipe
+        if existing:
+            cur.execute("DELETE FROM responses WHERE user_id = ?", (user.id,))
+            logger.info("[START] Deleted all old responses for user %s", user.id)
 
         # Select questions and reset state
+        now = time.time()
         selected_questions = get_random_questions()
-        questions_json = json.dumps(selected_questions)
-
-        cur.execute("""
-        UPDATE candidates
-        SET username = ?, question_index = 1, last_time = ?, completed = 0,
-            score = 0, ai_score = 0, decision = NULL, feedback = NULL,
-            has_completed_interview = 0, selected_questions = ?,
-            abandoned_alerted = 0
-        WHERE user_id = ?
-        """, (user.username, time.time(), questions_json, user.id))
-
-        if cur.rowcount == 0:
-            cur.execute("""
-            INSERT INTO candidates
-            (user_id, username, question_index, last_time, completed, score, ai_score, decision, feedback, has_completed_interview, selected_questions)
-            VALUES (?, ?, 1, ?, 0, 0, 0, NULL, NULL, 0, ?)
-            """, (user.id, user.username, time.time(), questions_json))
+        # selected_questions is a TEXT column, so store the decoded str
+        questions_json = orjson.dumps(selected_questions).decode()
+
+        cur.execute(_RESET_CANDIDATE_SQL, (user.id, user.username, now, questions_json))
 
+        # Single commit for the response wipe and the candidate reset
         conn.commit()
-        logger.info(f"[START] Fresh interview started for user {user.id} {'(ADMIN TEST MODE)' if is_admin_user else ''}")
-
-        welcome_message = (
-            "Hello! 👋\n\n"
-            "We're happy to see you're interested in becoming part of our team.\n\n"
-            f"We'll now proceed with the interview phase. This consists of {len(selected_questions)} short questions designed to understand "
-            "how you communicate, handle different fan situations, and whether your style aligns with what we're looking for.\n\n"
-            "There are no trick questions. Just be yourself and answer naturally."
-        )
+        # Questions are fixed for the rest of the interview; keep the decoded list
+        # so answers don't re-read and re-parse selected_questions. Cached only once
+        # stored, so a failed reset can't leave answers scored against unsaved questions
+        context.user_data['questions'] = selected_questions
+        logger.info("[START] Fresh interview started for user %s %s", user.id, '(ADMIN TEST MODE)' if is_admin_user else '')
+
+        welcome_message = _WELCOME_TEMPLATE.format_map({'count': len(selected_questions)})
         if is_admin_user:
-            welcome_message = "🛠️ Admin Test Mode\n\n" + welcome_message
+            welcome_message = _ADMIN_TEST_PREFIX + welcome_message
 
         await update.message.reply_text(welcome_message)
         if user.username:
@@ -262,9 +318,10 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 "please contact the admin before continuing — your results may not save correctly."
             )
         await update.message.reply_text(f"(1/{len(selected_questions)}) {selected_questions[0]}")
-        logger.info(f"Welcome and first question sent to user {user.id}")
+        logger.info("Welcome and first question sent to user %s", user.id)
     except Exception as e:
-        logger.error(f"Error in start handler: {e}", exc_info=True)
+        get_connection().rollback()
+        logger.error("Error in start handler: %s", e, exc_info=True)
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -275,12 +332,9 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         cur = get_cursor()
         conn = get_connection()
 
-        logger.info(f"User {user.id} (@{user.username}) sent message: {text[:50]}...")
+        logger.debug("User %s (@%s) sent message: %s...", user.id, user.username, text[:50])
 
-        cur.execute("""
-            SELECT question_index, last_time, has_completed_interview
-            FROM candidates WHERE user_id = ?
-        """, (user.id,))
+        cur.execute(_ANSWER_STATE_SQL, (user.id,))
         row = cur.fetchone()
 
         if not row:
@@ -291,7 +345,10 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
 
-        index, last_time, has_completed = row
+        index = row["question_index"]
+        last_time = row["last_time"]
+        has_completed = row["has_completed_interview"]
+        current_score = row["score"]
 
         is_admin_user = is_admin(user.id)
         if has_completed == 1 and not is_admin_user:
@@ -300,191 +357,166 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
         elif has_completed == 1 and is_admin_user:
-            logger.info(f"Admin {user.id} continuing after completion - resetting lock")
+            logger.info("Admin %s continuing after completion - resetting lock", user.id)
             cur.execute("UPDATE candidates SET has_completed_interview = 0, completed = 0 WHERE user_id = ?", (user.id,))
+            # Committed before routing so no transaction stays open across an await
             conn.commit()
 
-        # Route to state handler
+        # Route to state handler; it commits or rolls back its own writes before replying
         if index >= 1:
-            await _handle_answer(update, text, index, user.id, last_time, cur, conn, context)
+            await _handle_answer(update, text, index, user.id, last_time, current_score,
+                                 cur, conn, context, is_admin_user)
         else:
             await update.message.reply_text("Sorry, an error occurred. Please use /start to begin.")
 
     except Exception as e:
-        logger.error(f"Error in handle_message: {e}", exc_info=True)
+        get_connection().rollback()
+        logger.error("Error in handle_message: %s", e, exc_info=True)
         try:
             await update.message.reply_text("Sorry, an error occurred. Please try again.")
         except Exception as send_error:
-            logger.error(f"Failed to send error message: {send_error}")
+            logger.error("Failed to send error message: %s", send_error)
 
 
 async def _handle_answer(update: Update, text: str, index: int, user_id: int,
-                         last_time: float, cur, conn, context):
-    """Handle answer to question - score and move to next."""
-    user_questions = get_user_questions(cur, user_id)
+                         last_time: float, current_score: int, cur, conn, context,
+                         is_admin_user: bool):
+    """Handle answer to question - score and move to next.
+
+    handle_message has already applied the completion lock for this row.
+    """
+    user_questions = context.user_data.get('questions')
     if not user_questions:
-        await update.message.reply_text("Sorry, an error occurred. Please start over with /start")
-        logger.error(f"No questions found for user {user_id}")
-        return
+        # Cold start (e.g. bot restarted mid-interview): load once from the DB
+        user_questions = get_user_questions(cur, user_id)
+        if not user_questions:
+            await update.message.reply_text("Sorry, an error occurred. Please start over with /start")
+            logger.error("No questions found for user %s", user_id)
+            return
+        context.user_data['questions'] = user_questions
 
+    # No "already answered?" probe needed: the application processes updates one
+    # at a time (PTB's default update processor) and the response row is
+    # committed atomically with question_index, so a double-tap reads the
+    # already-advanced index
     previous_question_num = index - 1
 
-    # Check idempotency
-    cur.execute("SELECT id FROM responses WHERE user_id = ? AND question_number = ?",
-                (user_id, previous_question_num))
-    if cur.fetchone():
-        logger.warning(f"User {user_id} tried to score question {previous_question_num} AGAIN - moving to next question")
-        if index < len(user_questions):
-            cur.execute("UPDATE candidates SET question_index = question_index + 1, last_time = ? WHERE user_id = ?",
-                        (time.time(), user_id))
-            conn.commit()
-            await update.message.reply_text(user_questions[index])
-        return
-
-    cur.execute("SELECT score, ai_score, has_completed_interview FROM candidates WHERE user_id=?", (user_id,))
-    current_state = cur.fetchone()
-
-    if not current_state:
-        await update.message.reply_text("Sorry, an error occurred. Please start over with /start")
-        return
-
-    current_score, current_ai_score, has_completed_check = current_state
-
-    is_admin_user = is_admin(user_id)
-    if has_completed_check == 1 and not is_admin_user:
-        await update.message.reply_text("You have already completed the interview. Please use /start to see your results.")
-        return
-    elif has_completed_check == 1 and is_admin_user:
-        logger.info(f"Admin {user_id} answering after completion - resetting lock")
-        cur.execute("UPDATE candidates SET has_completed_interview = 0, completed = 0 WHERE user_id = ?", (user_id,))
-        conn.commit()
-
-    response_time = time.time() - last_time
+    # One clock read per answer: the response timestamp, last_time and the
+    # measured response time all refer to the moment the answer arrived
+    now = time.time()
+    response_time = now - last_time
     previous_question_text = user_questions[previous_question_num] if 0 <= previous_question_num < len(user_questions) else "Initial message"
 
-    logger.info(f"Scoring response for user {user_id}, question {previous_question_num}")
+    logger.info("Scoring response for user %s, question %s", user_id, previous_question_num)
     score, ai_score = analyze_response(text, response_time)
 
-    cur.execute("""
-    INSERT INTO responses (user_id, question_number, question_text, response_text, response_time, timestamp)
-    VALUES (?, ?, ?, ?, ?, ?)
-    """, (user_id, previous_question_num, previous_question_text, text, response_time, time.time()))
-    conn.commit()
+    cur.execute(_INSERT_RESPONSE_SQL, (user_id, previous_question_num, previous_question_text, text, response_time, now))
 
     max_possible_score = QUESTIONS_PER_INTERVIEW * 10
     if current_score > max_possible_score:
-        logger.error(f"Current score {current_score} exceeds maximum {max_possible_score} for user {user_id}")
+        logger.error("Current score %s exceeds maximum %s for user %s", current_score, max_possible_score, user_id)
         cur.execute("UPDATE candidates SET score = 0, ai_score = 0 WHERE user_id = ?", (user_id,))
-        conn.commit()
 
-    if is_admin_user:
-        cur.execute("""
-        UPDATE candidates
-        SET score = score + ?, ai_score = ai_score + ?, question_index = question_index + 1, last_time = ?
-        WHERE user_id = ?
-        """, (score, ai_score, time.time(), user_id))
-    else:
-        cur.execute("""
-        UPDATE candidates
-        SET score = score + ?, ai_score = ai_score + ?, question_index = question_index + 1, last_time = ?
-        WHERE user_id = ? AND has_completed_interview = 0
-        """, (score, ai_score, time.time(), user_id))
+    cur.execute(_ADVANCE_ANSWER_SQL, (score, ai_score, now, user_id, int(is_admin_user)))
 
     if cur.rowcount == 0:
+        conn.rollback()
         await update.message.reply_text("Sorry, an error occurred. Please contact support.")
         return
 
-    conn.commit()
-    logger.info(f"User {user_id}, Question {previous_question_num}: Added score={score}, ai_score={ai_score}")
+    logger.info("User %s, Question %s: Added score=%s, ai_score=%s", user_id, previous_question_num, score, ai_score)
 
     if index < len(user_questions):
+        # One commit for the response insert and the score/index update
+        conn.commit()
         await update.message.reply_text(f"({index + 1}/{len(user_questions)}) {user_questions[index]}")
-        logger.info(f"Sent question {index} to user {user_id}")
+        logger.info("Sent question %s to user %s", index, user_id)
     else:
-        await _complete_interview(user_id, cur, conn, update, context)
+        # The last answer is committed together with the completion lock
+        await _complete_interview(user_id, cur, conn, update, context, is_admin_user, now)
 
 
-async def _complete_interview(user_id: int, cur, conn, update, context):
-    """Complete interview and determine final decision."""
-    is_admin_user = is_admin(user_id)
+async def _complete_interview(user_id: int, cur, conn, update, context, is_admin_user: bool,
+                              now: float):
+    """Complete interview and determine final decision.
 
-    cur.execute("SELECT has_completed_interview, score, ai_score FROM candidates WHERE user_id=?", (user_id,))
+    now is the last answer's arrival time from _handle_answer, reused for last_time.
+    """
+    cur.execute(_FINAL_STATE_SQL, (user_id,))
     final_check = cur.fetchone()
 
     if not final_check:
+        conn.rollback()
         await update.message.reply_text("Sorry, an error occurred. Please contact support.")
         return
 
-    has_completed, final_score, final_ai_score = final_check
+    has_completed = final_check["has_completed_interview"]
+    final_score = final_check["score"]
+    final_ai_score = final_check["ai_score"]
 
     if has_completed == 1 and not is_admin_user:
+        conn.rollback()
         await update.message.reply_text("You have already completed the interview. Please use /start to see your results.")
         return
     elif has_completed == 1 and is_admin_user:
-        logger.info(f"Admin {user_id} completing interview again (test mode)")
+        logger.info("Admin %s completing interview again (test mode)", user_id)
 
     max_possible_score = QUESTIONS_PER_INTERVIEW * 10
     if final_score > max_possible_score:
-        logger.error(f"Final score {final_score} exceeds maximum {max_possible_score} - capping")
+        logger.error("Final score %s exceeds maximum %s - capping", final_score, max_possible_score)
         final_score = max_possible_score
         cur.execute("UPDATE candidates SET score = ? WHERE user_id = ?", (final_score, user_id))
-        conn.commit()
 
     decision = determine_decision(final_score, final_ai_score)
-    logger.info(f"FINAL DECISION: User {user_id}, Score: {final_score}, AI Score: {final_ai_score}, Decision: {decision}")
+    logger.info("FINAL DECISION: User %s, Score: %s, AI Score: %s, Decision: %s", user_id, final_score, final_ai_score, decision)
 
     feedback = generate_feedback(final_score, final_ai_score, decision)
 
-    if is_admin_user:
-        cur.execute("""
-        UPDATE candidates
-        SET completed = 1, has_completed_interview = 1, decision = ?, feedback = ?, last_time = ?
-        WHERE user_id = ?
-        """, (decision, feedback, time.time(), user_id))
-    else:
-        cur.execute("""
-        UPDATE candidates
-        SET completed = 1, has_completed_interview = 1, decision = ?, feedback = ?, last_time = ?
-        WHERE user_id = ? AND has_completed_interview = 0
-        """, (decision, feedback, time.time(), user_id))
-    conn.commit()
+    cur.execute(_COMPLETE_INTERVIEW_SQL, (decision, feedback, now, user_id, int(is_admin_user)))
 
+    # The guarded UPDATE only misses if the row vanished or was locked in the
+    # meantime; updates are processed one at a time, so no re-read is needed
+    if cur.rowcount == 0:
+        logger.error("Completion lock could not be set for user %s", user_id)
+        conn.rollback()
+        await update.message.reply_text("Sorry, an error occurred. Please contact support.")
+        return
     if not is_admin_user:
-        cur.execute("SELECT has_completed_interview, completed FROM candidates WHERE user_id=?", (user_id,))
-        verify_lock = cur.fetchone()
-        if verify_lock and (verify_lock[0] != 1 or verify_lock[1] != 1):
-            logger.error(f"Completion lock verification failed for user {user_id}")
-            cur.execute("UPDATE candidates SET completed = 1, has_completed_interview = 1 WHERE user_id = ?", (user_id,))
-            conn.commit()
-        else:
-            logger.info(f"PERMANENT LOCK VERIFIED: User {user_id}, interview completed")
+        logger.info("PERMANENT LOCK VERIFIED: User %s, interview completed", user_id)
     else:
-        logger.info(f"Interview completed for admin {user_id} (test mode - can retake)")
+        logger.info("Interview completed for admin %s (test mode - can retake)", user_id)
+    # Single commit for the last answer, score cap and completion lock
+    conn.commit()
+    context.user_data.pop('questions', None)
 
     if is_admin_user:
-        await update.message.reply_text(feedback + "\n\n🛠️ Admin Test Mode: You can retake this interview anytime using /start")
-        logger.info(f"Interview completed for admin {user_id} (test mode) - Decision: {decision}")
+        await update.message.reply_text(feedback + _ADMIN_FEEDBACK_SUFFIX)
+        logger.info("Interview completed for admin %s (test mode) - Decision: %s", user_id, decision)
     else:
         await update.message.reply_text(feedback)
-        logger.info(f"Interview completed for user {user_id} - Decision: {decision}")
+        logger.info("Interview completed for user %s - Decision: %s", user_id, decision)
 
     try:
-        import bot
-        admin_ids = getattr(bot, 'ADMIN_IDS', [])
+        admin_ids = _load_admin_ids()
     except (ImportError, AttributeError) as e:
-        logger.error(f"Failed to get ADMIN_IDS: {e}")
+        logger.error("Failed to get ADMIN_IDS: %s", e)
         admin_ids = []
 
     if not is_admin_user:
+        # Snapshot the report now; the sends run in the background so the
+        # ClickUp push below isn't held up by admin message round trips
         try:
-            await notify_admin(user_id, context, cur, admin_ids)
+            report = collect_admin_report(user_id, cur)
         except Exception as e:
-            logger.error(f"notify_admin failed: {e}")
-
-    # Push results to ClickUp (all users including admins)
-    cur.execute("SELECT username FROM candidates WHERE user_id = ?", (user_id,))
-    row = cur.fetchone()
-    username = (row[0] or "") if row else ""
+            logger.error("collect_admin_report failed for user %s: %s", user_id, e)
+            report = None
+        if report:
+            context.application.create_task(notify_admin(user_id, context, report, admin_ids))
+
+    # Push results to ClickUp (all users including admins); username and name
+    # come from the final-state row, which the completion UPDATE leaves untouched
+    username = final_check["username"] or ""
+    replies = None
     clickup_error = None
     if username:
         try:
@@ -492,20 +524,20 @@ async def _complete_interview(user_id: int, cur, conn, update, context):
             replies = _build_replies_text(cur, user_id)
             push_interview_results(username, decision, final_score, replies)
         except LookupError as e:
-            logger.warning(f"ClickUp task not found for @{username}: {e}")
+            logger.warning("ClickUp task not found for @%s: %s", username, e)
             clickup_error = f"No matching ClickUp task — handle on application doesn't match @{username}"
         except Exception as e:
-            logger.exception(f"Failed to push results to ClickUp for @{username}: {e}")
+            logger.exception("Failed to push results to ClickUp for @%s: %s", username, e)
             clickup_error = f"{type(e).__name__}: {e}"
     else:
-        logger.warning(f"No username for user {user_id}, skipping ClickUp push")
+        logger.warning("No username for user %s, skipping ClickUp push", user_id)
         clickup_error = "Candidate has no Telegram @username set on their account"
 
     if clickup_error:
-        cur.execute("SELECT name FROM candidates WHERE user_id = ?", (user_id,))
-        name_row = cur.fetchone()
-        candidate_name = name_row[0] if name_row and name_row[0] else "(unknown)"
-        replies_text = _build_replies_text(cur, user_id) or "(no responses recorded)"
+        candidate_name = final_check["name"] or "(unknown)"
+        if replies is None:
+            replies = _build_replies_text(cur, user_id)
+        replies_text = replies or "(no responses recorded)"
         header = (
             "⚠️ ClickUp push FAILED — manual update needed\n\n"
             f"Candidate: {candidate_name}\n"
@@ -535,7 +567,7 @@ async def _complete_interview(user_id: int, cur, conn, update, context):
                 try:
                     await context.bot.send_message(chat_id=admin, text=chunk)
                 except Exception as e:
-                    logger.error(f"Failed to send ClickUp failure alert to admin {admin}: {e}")
+                    logger.error("Failed to send ClickUp failure alert to admin %s: %s", admin, e)
                     break
 
 
@@ -547,7 +579,7 @@ async def purge_command(update: Update, context: ContextTypes.DEFAULT_TYPE, admi
 
         if user_id not in admin_ids:
             await update.message.reply_text("❌ You don't have permission to use this command.")
-            logger.warning(f"User {user_id} attempted to use /purge without permission")
+            logger.warning("User %s attempted to use /purge without permission", user_id)
             return
 
         keyboard = InlineKeyboardMarkup([
@@ -559,9 +591,9 @@ async def purge_command(update: Update, context: ContextTypes.DEFAULT_TYPE, admi
             "Press Confirm purge only if you are sure.",
             reply_markup=keyboard,
         )
-        logger.info(f"Admin {user_id} opened purge confirmation")
+        logger.info("Admin %s opened purge confirmation", user_id)
     except Exception as e:
-        logger.error(f"Error in purge_command: {e}", exc_info=True)
+        logger.error("Error in purge_command: %s", e, exc_info=True)
         if update and update.message:
             await update.message.reply_text("❌ Error opening purge confirmation. Check logs.")
 
@@ -578,11 +610,11 @@ async def payment_callback_handler(update: Update, context: ContextTypes.DEFAULT
     if data == PURGE_CONFIRM_CALLBACK:
         if not is_admin(user_id):
             await query.edit_message_text("You do not have permission to purge the database.")
-            logger.warning(f"User {user_id} attempted to confirm purge without permission")
+            logger.warning("User %s attempted to confirm purge without permission", user_id)
             return
         try:
             clear_database()
-            logger.warning(f"Admin {user_id} purged the database")
+            logger.warning("Admin %s purged the database", user_id)
             await query.edit_message_text("Database purged successfully.")
         except Exception:
             logger.exception("Admin purge failed")
@@ -592,9 +624,9 @@ async def payment_callback_handler(update: Update, context: ContextTypes.DEFAULT
     if data == PURGE_CANCEL_CALLBACK:
         if not is_admin(user_id):
             await query.edit_message_text("You do not have permission to manage purge actions.")
-            logger.warning(f"User {user_id} attempted to cancel purge without permission")
+            logger.warning("User %s attempted to cancel purge without permission", user_id)
             return
-        logger.info(f"Admin {user_id} cancelled database purge")
+        logger.info("Admin %s cancelled database purge", user_id)
         await query.edit_message_text("Database purge cancelled.")
         return
 
@@ -607,10 +639,10 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE, admin
 
         if user_id not in admin_ids:
             await update.message.reply_text("❌ You don't have permission to use this command.")
-            logger.warning(f"User {user_id} attempted to use /stop command without permission")
+            logger.warning("User %s attempted to use /stop command without permission", user_id)
             return
 
-        logger.info(f"Admin {user_id} requested bot shutdown")
+        logger.info("Admin %s requested bot shutdown", user_id)
         await update.message.reply_text("🛑 Stopping bot... Please wait.")
 
         success = stop_bot_func()
@@ -625,7 +657,7 @@ async def stop_command(update: Update, context: ContextTypes.DEFAULT_TYPE, admin
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Error in stop_command: {e}", exc_info=True)
+        logger.error("Error in stop_command: %s", e, exc_info=True)
         if update and update.message:
             await update.message.reply_text("❌ Error stopping bot. Check logs.")
 
@@ -6,7 +6,8 @@ Each interview randomly selects 10 questions from this pool.
 import random
 
 # Question pool - 49 questions total, randomly select 5 from these for each interview
-QUESTION_POOL = [
+# (a tuple: the pool is fixed, so nothing needs to copy or guard it)
+QUESTION_POOL = (
     # FAN PSYCHOLOGY & INTENT READING
     "Fan: I don't usually subscribe to girls like you… but something about you feels different.",
     "A fan is very chatty, flirty, and affectionate, but hasn't spent yet. What signals do you look for before trying to monetize?",
@@ -73,11 +74,19 @@ QUESTION_POOL = [
     "Fan: I thought we had a connection, but you just want my money",
     "Fan: You're not like the others, that's why I like you",
     "Fan: Can we be friends? I don't want this to be just transactional"
-]
+)
 
 # Number of questions to ask per interview
 QUESTIONS_PER_INTERVIEW = 10
 
+if len(QUESTION_POOL) < QUESTIONS_PER_INTERVIEW:
+    raise ValueError(
+        f"QUESTION_POOL has {len(QUESTION_POOL)} questions, fewer than QUESTIONS_PER_INTERVIEW ({QUESTIONS_PER_INTERVIEW})"
+    )
+
+# Dedicated generator so question picks don't share the global random state
+_RNG = random.Random()
+
 
 def get_random_questions() -> list[str]:
     """
@@ -86,12 +95,8 @@ def get_random_questions() -> list[str]:
     Returns:
         List of 10 randomly selected questions
     """
-    if len(QUESTION_POOL) < QUESTIONS_PER_INTERVIEW:
-        # If pool is smaller than needed, just return all questions
-        return QUESTION_POOL.copy()
-    
-    # Randomly sample without replacement
-    return random.sample(QUESTION_POOL, QUESTIONS_PER_INTERVIEW)
+    # Randomly sample without replacement (pool size is checked at import)
+    return _RNG.sample(QUESTION_POOL, QUESTIONS_PER_INTERVIEW)
 
 
 # For backwards compatibility - but don't use this directly
@@ -11,6 +11,8 @@ Key Principles:
 - Natural conversation flow with appropriate pacing scores well
 """
 
+from operator import mul
+
 
 def analyze_response(text: str, response_time: float) -> tuple[int, int]:
     """
@@ -36,23 +38,27 @@ def analyze_response(text: str, response_time: float) -> tuple[int, int]:
     words = text.split()
     word_count = len(words)
 
+    # Keyword groups several scorers share are scanned once here and passed down
+    has_contractions = any(cont in lower for cont in _CONTRACTIONS)
+    sales_word_count = sum(1 for word in _SALES_WORDS if word in lower)
+
     # 1. FAN CONTROL & POWER (0-2 points)
-    score += _score_fan_control(text, lower)
+    score += _score_fan_control(lower)
 
     # 2. EMOTIONAL INVESTMENT BUILDING (0-2 points)
     score += _score_emotional_investment(lower)
 
     # 3. MONETIZATION TRAJECTORY (0-2 points)
-    score += _score_monetization(lower)
+    score += _score_monetization(lower, sales_word_count)
 
     # 4. REBUTTAL SKILL (0-2 points)
     score += _score_rebuttal(lower, word_count)
 
     # 5. PACING & REALISM (0-2 points)
-    score += _score_pacing(lower, word_count)
+    score += _score_pacing(lower, word_count, has_contractions, sales_word_count)
 
     # AI DETECTION (flag but don't auto-fail)
-    ai_score = _detect_ai_indicators(text, lower, word_count, response_time)
+    ai_score = _detect_ai_indicators(text, lower, word_count, response_time, has_contractions)
 
     # Cap scores appropriately
     score = min(score, 10)
@@ -61,17 +67,21 @@ def analyze_response(text: str, response_time: float) -> tuple[int, int]:
     return score, ai_score
 
 
-def _score_fan_control(text: str, lower: str) -> int:
+# Keyword groups are module-level tuples so they are built once at import, not
+# on every call. Matching stays plain substring search against the lowercased
+# text: `in` on short strings beats a compiled alternation for these groups.
+_CONFIDENT_PHRASES = ("i want", "i'd love", "i can", "when you", "if you", "for me", "i'd like")
+_NEEDY_PHRASES = ("please", "i need", "i hope", "maybe", "i guess", "i think so")
+_SUBMISSIVE_PHRASES = ("sorry", "apologies", "i apologize", "my fault", "i'm so sorry")
+
+
+def _score_fan_control(lower: str) -> int:
     """Score fan control and power (0-2 points). More lenient scoring."""
     control_score = 0
     
-    confident_phrases = ["i want", "i'd love", "i can", "when you", "if you", "for me", "i'd like"]
-    needy_phrases = ["please", "i need", "i hope", "maybe", "i guess", "i think so"]
-    submissive_phrases = ["sorry", "apologies", "i apologize", "my fault", "i'm so sorry"]
-    
-    has_confidence = any(phrase in lower for phrase in confident_phrases)
-    has_needy = any(phrase in lower for phrase in needy_phrases)
-    has_submissive = any(phrase in lower for phrase in submissive_phrases)
+    has_confidence = any(phrase in lower for phrase in _CONFIDENT_PHRASES)
+    has_needy = any(phrase in lower for phrase in _NEEDY_PHRASES)
+    has_submissive = any(phrase in lower for phrase in _SUBMISSIVE_PHRASES)
     
     # More lenient: Give points if not overly needy/submissive
     if has_confidence and not has_needy and not has_submissive:
@@ -82,12 +92,21 @@ def _score_fan_control(text: str, lower: str) -> int:
         control_score = 1
     
     # Only penalize excessive apologizing (3+ times)
-    if text.lower().count("sorry") >= 3:
+    if lower.count("sorry") >= 3:
         control_score = max(0, control_score - 1)
     
     return control_score
 
 
+# Relationship building indicators
+_CHOSEN_PHRASES = ("for you", "special", "only you", "just for you", "you're different", "you're unique")
+_CURIOSITY_PHRASES = ("imagine", "what if", "think about", "picture", "later", "when", "someday")
+_PERSONAL_PHRASES = ("i love", "i'm into", "i'm drawn to", "you make me", "you're", "i feel", "i appreciate")
+_CONNECTION_PHRASES = ("miss you", "think about you", "remember", "wish", "understand", "get you", "hear you")
+_COMPLETION_PHRASES = ("i love you", "i'm yours", "forever", "always", "promise")
+_SALES_PRESSURE_WORDS = ("buy", "pay", "tip now", "send money", "purchase", "order")
+
+
 def _score_emotional_investment(lower: str) -> int:
     """
     Score emotional investment building (0-2 points).
@@ -96,30 +115,22 @@ def _score_emotional_investment(lower: str) -> int:
     """
     emotional_score = 0
     
-    # Relationship building indicators
-    chosen_phrases = ["for you", "special", "only you", "just for you", "you're different", "you're unique"]
-    curiosity_phrases = ["imagine", "what if", "think about", "picture", "later", "when", "someday"]
-    personal_phrases = ["i love", "i'm into", "i'm drawn to", "you make me", "you're", "i feel", "i appreciate"]
-    connection_phrases = ["miss you", "think about you", "remember", "wish", "understand", "get you", "hear you"]
-    completion_phrases = ["i love you", "i'm yours", "forever", "always", "promise"]
-    
     # Building rapport/relationship (even without sales setup)
-    has_chosen = any(phrase in lower for phrase in chosen_phrases)
-    has_curiosity = any(phrase in lower for phrase in curiosity_phrases)
-    has_personal = any(phrase in lower for phrase in personal_phrases)
-    has_connection = any(phrase in lower for phrase in connection_phrases)
+    has_chosen = any(phrase in lower for phrase in _CHOSEN_PHRASES)
+    has_curiosity = any(phrase in lower for phrase in _CURIOSITY_PHRASES)
+    has_personal = any(phrase in lower for phrase in _PERSONAL_PHRASES)
+    has_connection = any(phrase in lower for phrase in _CONNECTION_PHRASES)
     
     # Negative: Over-giving without relationship building
     over_giving = "free" in lower and ("pic" in lower or "photo" in lower or "video" in lower)
     
     # Check if overpushing sales (negative indicator for emotional building)
-    sales_pressure_words = ["buy", "pay", "tip now", "send money", "purchase", "order"]
-    is_overpushing = sum(1 for word in sales_pressure_words if word in lower) >= 2
+    is_overpushing = sum(1 for word in _SALES_PRESSURE_WORDS if word in lower) >= 2
     
     # Strong emotional building: Makes fan feel special + creates connection/curiosity
     # Relationship building itself is valuable, even without sales setup
     # More lenient: Give points for any relationship building indicator
-    if (has_chosen or has_curiosity) and (has_personal or has_connection) and not any(phrase in lower for phrase in completion_phrases):
+    if (has_chosen or has_curiosity) and (has_personal or has_connection) and not any(phrase in lower for phrase in _COMPLETION_PHRASES):
         emotional_score = 2  # Strong relationship building
     elif (has_chosen or has_curiosity or has_personal or has_connection) and not over_giving and not is_overpushing:
         emotional_score = 1  # Moderate relationship building
@@ -135,7 +146,16 @@ def _score_emotional_investment(lower: str) -> int:
     return emotional_score
 
 
-def _score_monetization(lower: str) -> int:
+# Subtle setup keywords (desire-based, not pushy)
+_DESIRE_KEYWORDS = ("spoil", "treat", "unlock", "exclusive", "special", "premium", "vip")
+_FUTURE_PPV_KEYWORDS = ("later", "next time", "when you", "if you want", "custom", "personal", "whenever you're ready")
+_SUBTLE_SALES = ("tip", "appreciate", "support", "help me", "for me", "when you're feeling generous")
+# Direct pressure/begging (BAD - automatic 0)
+_PRESSURE_PHRASES = ("buy now", "pay me", "send money", "give me", "i need money", "hurry", "limited time")
+_SALES_WORDS = ("buy", "pay", "tip", "purchase", "order", "send")
+
+
+def _score_monetization(lower: str, sales_word_count: int) -> int:
     """
     Score monetization trajectory (0-2 points).
     Setting up for sales subtly is good. Overpushing/overselling is bad.
@@ -144,24 +164,15 @@ def _score_monetization(lower: str) -> int:
     """
     monetization_score = 0
     
-    # Subtle setup keywords (desire-based, not pushy)
-    desire_keywords = ["spoil", "treat", "unlock", "exclusive", "special", "premium", "vip"]
-    future_ppv_keywords = ["later", "next time", "when you", "if you want", "custom", "personal", "whenever you're ready"]
-    subtle_sales = ["tip", "appreciate", "support", "help me", "for me", "when you're feeling generous"]
-    
-    # Direct pressure/begging (BAD - automatic 0)
-    pressure_phrases = ["buy now", "pay me", "send money", "give me", "i need money", "hurry", "limited time"]
-    
     # Overpushing indicators (multiple sales words = too pushy)
     # More lenient: Require 4+ sales words to be considered overpushing
-    sales_words = ["buy", "pay", "tip", "purchase", "order", "send"]
-    sales_word_count = sum(1 for word in sales_words if word in lower)
+    # (sales_word_count: how many of _SALES_WORDS occur, counted by analyze_response)
     is_overpushing = sales_word_count >= 4  # Multiple sales words = overpushing (increased threshold)
     
-    begging = any(phrase in lower for phrase in pressure_phrases)
-    has_desire = any(kw in lower for kw in desire_keywords)
-    has_future_setup = any(kw in lower for kw in future_ppv_keywords)
-    has_subtle = any(phrase in lower for phrase in subtle_sales)
+    begging = any(phrase in lower for phrase in _PRESSURE_PHRASES)
+    has_desire = any(kw in lower for kw in _DESIRE_KEYWORDS)
+    has_future_setup = any(kw in lower for kw in _FUTURE_PPV_KEYWORDS)
+    has_subtle = any(phrase in lower for phrase in _SUBTLE_SALES)
     
     # Strong setup: Subtle desire-based language + future framing, NOT pushy
     # More lenient: Give points for any monetization indicators (not just perfect combinations)
@@ -184,21 +195,23 @@ def _score_monetization(lower: str) -> int:
     return monetization_score
 
 
+_OBJECTION_WORDS = ("free", "expensive", "why", "but", "can't afford", "no money", "cheaper")
+_REFRAMING_PHRASES = ("i understand", "see it as", "think of it as", "it's more like", "you're worth")
+_CALM_PHRASES = ("no worries", "totally get it", "that's okay", "i hear you")
+_ARGUMENT_PHRASES = ("you're wrong", "that's not true", "no you", "you should")
+_MOMENTUM_WORDS = ("yes", "yeah", "sure", "absolutely", "definitely", "of course")
+
+
 def _score_rebuttal(lower: str, word_count: int) -> int:
     """Score rebuttal skill (0-2 points)."""
     rebuttal_score = 0
     
-    objection_words = ["free", "expensive", "why", "but", "can't afford", "no money", "cheaper"]
-    has_objection_context = any(word in lower for word in objection_words)
+    has_objection_context = any(word in lower for word in _OBJECTION_WORDS)
     
     if has_objection_context:
-        reframing_phrases = ["i understand", "see it as", "think of it as", "it's more like", "you're worth"]
-        calm_phrases = ["no worries", "totally get it", "that's okay", "i hear you"]
-        argument_phrases = ["you're wrong", "that's not true", "no you", "you should"]
-        
-        has_reframe = any(phrase in lower for phrase in reframing_phrases)
-        has_calm = any(phrase in lower for phrase in calm_phrases)
-        has_argument = any(phrase in lower for phrase in argument_phrases)
+        has_reframe = any(phrase in lower for phrase in _REFRAMING_PHRASES)
+        has_calm = any(phrase in lower for phrase in _CALM_PHRASES)
+        has_argument = any(phrase in lower for phrase in _ARGUMENT_PHRASES)
         
         if (has_reframe or has_calm) and not has_argument:
             rebuttal_score = 2
@@ -209,14 +222,19 @@ def _score_rebuttal(lower: str, word_count: int) -> int:
             rebuttal_score = 0
     else:
         # Maintain conversation momentum
-        momentum_words = ["yes", "yeah", "sure", "absolutely", "definitely", "of course"]
-        if any(word in lower for word in momentum_words) or word_count > 5:
+        if any(word in lower for word in _MOMENTUM_WORDS) or word_count > 5:
             rebuttal_score = 1
     
     return rebuttal_score
 
 
-def _score_pacing(lower: str, word_count: int) -> int:
+_CONTRACTIONS = ("i'm", "i've", "don't", "can't", "won't", "it's", "that's", "you're", "we're")
+_CASUAL_WORDS = ("yeah", "yep", "hmm", "mm", "haha", "lol", "omg", "tbh", "fr")
+_CORPORATE_PHRASES = ("i understand", "i appreciate", "thank you for", "i would be happy to")
+_SALESY_PHRASES = ("limited time", "act now", "don't miss out", "buy today", "hurry up")
+
+
+def _score_pacing(lower: str, word_count: int, has_contractions: bool, sales_word_count: int) -> int:
     """
     Score pacing and realism (0-2 points).
     Natural conversation flow without overpushing sales.
@@ -224,22 +242,16 @@ def _score_pacing(lower: str, word_count: int) -> int:
     """
     pacing_score = 0
     
-    contractions = ["i'm", "i've", "don't", "can't", "won't", "it's", "that's", "you're", "we're"]
-    has_contractions = any(cont in lower for cont in contractions)
-    casual_words = ["yeah", "yep", "hmm", "mm", "haha", "lol", "omg", "tbh", "fr"]
-    has_casual = any(cw in lower for cw in casual_words)
-    
-    corporate_phrases = ["i understand", "i appreciate", "thank you for", "i would be happy to"]
-    salesy_phrases = ["limited time", "act now", "don't miss out", "buy today", "hurry up"]
+    has_casual = any(cw in lower for cw in _CASUAL_WORDS)
     
     # Overpushing indicators (multiple sales pushes = bad pacing)
     # More lenient: Require 4+ sales words to be considered overpushing
-    sales_push_words = ["buy", "pay", "tip", "purchase", "order", "send", "money"]
-    sales_push_count = sum(1 for word in sales_push_words if word in lower)
+    # Sales push words are _SALES_WORDS plus "money"
+    sales_push_count = sales_word_count + ("money" in lower)
     is_overpushing = sales_push_count >= 4  # Multiple sales words = overpushing (increased threshold)
     
-    has_corporate = any(phrase in lower for phrase in corporate_phrases)
-    has_salesy = any(phrase in lower for phrase in salesy_phrases)
+    has_corporate = any(phrase in lower for phrase in _CORPORATE_PHRASES)
+    has_salesy = any(phrase in lower for phrase in _SALESY_PHRASES)
     
     appropriate_length = 5 <= word_count <= 60
     
@@ -258,41 +270,47 @@ def _score_pacing(lower: str, word_count: int) -> int:
     return pacing_score
 
 
-def _detect_ai_indicators(text: str, lower: str, word_count: int, response_time: float) -> int:
+_GENERIC_PHRASES = ("i understand", "i appreciate", "i would be happy", "thank you for")
+_CORPORATE_WORDS = ("certainly", "absolutely", "furthermore", "moreover", "additionally")
+
+
+def _detect_ai_indicators(text: str, lower: str, word_count: int, response_time: float,
+                          has_contractions: bool) -> int:
     """Detect AI use indicators (0-10 scale, higher = more AI-like). More lenient detection."""
     ai_score = 0
     
     # Overly polished grammar (more lenient thresholds)
     if text.count(",") > 6:  # Increased from 4 to 6
         ai_score += 2
-    if text.count(".") > 7:  # Increased from 5 to 7
+    period_count = text.count(".")
+    if period_count > 7:  # Increased from 5 to 7
         ai_score += 1
     
     # Generic customer support phrases (only flag if multiple)
-    generic_phrases = ["i understand", "i appreciate", "i would be happy", "thank you for"]
-    generic_count = sum(1 for phrase in generic_phrases if phrase in lower)
+    generic_count = sum(1 for phrase in _GENERIC_PHRASES if phrase in lower)
     if generic_count >= 2:  # Only flag if 2+ generic phrases
         ai_score += 2
     
     # Repetitive sentence structure (more lenient)
-    sentences = [s.strip() for s in text.replace("!", ".").replace("?", ".").split(".") if s.strip()]
-    if len(sentences) > 3:  # Increased from 2 to 3
-        lengths = [len(s.split()) for s in sentences]
-        if lengths:
-            avg_len = sum(lengths) / len(lengths)
-            variance = sum((l - avg_len) ** 2 for l in lengths) / len(lengths)
-            if variance < 3:  # More strict variance check (decreased from 5 to 3)
+    # More than 3 sentences needs at least 3 delimiters, so short replies skip the split
+    if period_count + text.count("!") + text.count("?") >= 3:
+        # Word count per sentence, in one pass: a piece with no words (blank or only
+        # whitespace) is not a sentence, so it drops out without a separate strip()
+        lengths = [n for n in map(len, map(str.split, text.replace("!", ".").replace("?", ".").split("."))) if n]
+        if len(lengths) > 3:  # Increased from 2 to 3
+            # More strict variance check (decreased from 5 to 3): population variance < 3,
+            # kept in exact integers as n * sum(l^2) - sum(l)^2 < 3 * n^2
+            n = len(lengths)
+            total = sum(lengths)
+            if n * sum(map(mul, lengths, lengths)) - total * total < 3 * n * n:
                 ai_score += 2
     
     # No contractions when they should be used (more lenient)
-    contractions = ["i'm", "i've", "don't", "can't", "won't", "it's", "that's", "you're", "we're"]
-    has_contractions = any(cont in lower for cont in contractions)
     if word_count > 15 and not has_contractions:  # Increased from 10 to 15
         ai_score += 1
     
     # Corporate/customer support tone (only flag multiple)
-    corporate_words = ["certainly", "absolutely", "furthermore", "moreover", "additionally"]
-    corporate_count = sum(1 for cw in corporate_words if cw in lower)
+    corporate_count = sum(1 for cw in _CORPORATE_WORDS if cw in lower)
     if corporate_count >= 2:  # Only flag if 2+ corporate words
         ai_score += 2
     
@@ -307,6 +325,13 @@ def _detect_ai_indicators(text: str, lower: str, word_count: int, response_time:
     return ai_score
 
 
+# (minimum score, maximum ai_score, decision), checked in order; anything else is NOT ELIGIBLE
+_DECISION_THRESHOLDS = (
+    (20, 7, "APPROVED"),
+    (15, 9, "BORDERLINE"),
+)
+
+
 def determine_decision(score: int, ai_score: int) -> str:
     """
     Determine final decision based on scores.
@@ -321,9 +346,7 @@ def determine_decision(score: int, ai_score: int) -> str:
     # reworking the scoring rubric itself.
     # APPROVED: 20+ (40%) with stricter AI tolerance
     # BORDERLINE: 15+ (30%) with slightly stricter AI tolerance
-    if score >= 20 and ai_score <= 7:
-        return "APPROVED"
-    elif score >= 15 and ai_score <= 9:
-        return "BORDERLINE"
-    else:
-        return "NOT ELIGIBLE"
+    for min_score, max_ai_score, decision in _DECISION_THRESHOLDS:
+        if score >= min_score and ai_score <= max_ai_score:
+            return decision
+    return "NOT ELIGIBLE"
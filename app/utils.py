@@ -2,6 +2,7 @@
 Utility functions for feedback generation and admin notifications
 """
 
+import asyncio
 import logging
 from app.questions import QUESTIONS_PER_INTERVIEW
 
@@ -43,27 +44,46 @@ def generate_feedback(score: int, ai_score: int, decision: str) -> str:
         )
 
 
-async def notify_admin(user_id: int, context, cur, admin_ids):
+def collect_admin_report(user_id: int, cur):
+    """
+    Read what notify_admin needs into a plain dict.
+    Runs synchronously on the handler's cursor so the notification itself
+    can be sent from a background task without touching the database.
+    """
+    cur.execute("SELECT username, name, score, ai_score, decision FROM candidates WHERE user_id=?", (user_id,))
+    row = cur.fetchone()
+    if not row:
+        logger.warning("No data found for user %s when trying to notify admin", user_id)
+        return None
+
+    # Get all responses
+    cur.execute("""
+    SELECT question_number, question_text, response_text, response_time 
+    FROM responses 
+    WHERE user_id = ? 
+    ORDER BY question_number
+    """, (user_id,))
+    return {
+        'username': row["username"],
+        'name': row["name"],
+        'score': row["score"],
+        'ai_score': row["ai_score"],
+        'decision': row["decision"],
+        'responses': cur.fetchall(),
+    }
+
+
+async def notify_admin(user_id: int, context, report, admin_ids):
     """Notify admin about completed interview."""
     try:
-        cur.execute("SELECT username, name, score, ai_score, decision FROM candidates WHERE user_id=?", (user_id,))
-        row = cur.fetchone()
-        if not row:
-            logger.warning(f"No data found for user {user_id} when trying to notify admin")
-            return
-        
-        username, candidate_name, score, ai_score, decision = row
+        username = report['username']
+        candidate_name = report['name']
+        score = report['score']
+        ai_score = report['ai_score']
+        decision = report['decision']
+        responses = report['responses']
         display_name = candidate_name if candidate_name else f"@{username}" if username else f"User {user_id}"
 
-        # Get all responses
-        cur.execute("""
-        SELECT question_number, question_text, response_text, response_time 
-        FROM responses 
-        WHERE user_id = ? 
-        ORDER BY question_number
-        """, (user_id,))
-        responses = cur.fetchall()
-
         max_score = QUESTIONS_PER_INTERVIEW * 10
         percentage = (score / max_score * 100) if max_score > 0 else 0
 
@@ -92,11 +112,14 @@ async def notify_admin(user_id: int, context, cur, admin_ids):
             )
 
         # Build response summary
-        response_summary = "\n\n📝 Responses:\n"
+        parts = ["\n\n📝 Responses:\n"]
         for q_num, q_text, r_text, r_time in responses:
-            response_summary += f"\nQ{q_num+1}: {q_text}\n"
-            response_summary += f"A: {r_text[:100]}{'...' if len(r_text) > 100 else ''}\n"
-            response_summary += f"Response time: {r_time:.1f}s\n"
+            parts.append(
+                f"\nQ{q_num+1}: {q_text}\n"
+                f"A: {r_text[:100]}{'...' if len(r_text) > 100 else ''}\n"
+                f"Response time: {r_time:.1f}s\n"
+            )
+        response_summary = "".join(parts)
 
         message = (
             f"📋 Interview Evaluation\n\n"
@@ -110,30 +133,34 @@ async def notify_admin(user_id: int, context, cur, admin_ids):
             f"{response_summary}"
         )
 
-        for admin in admin_ids:
-            try:
-                if len(message) > 4000:
-                    summary_msg = (
-                        f"📋 Interview Evaluation\n\n"
-                        f"Candidate: {display_name}\n"
-                        f"Username: @{username or 'N/A'}\n"
-                        f"User ID: {user_id}\n"
-                        f"Decision: {decision}\n"
-                        f"Score: {score}\n"
-                        f"AI Assessment: {ai_note}\n\n"
-                        f"Feedback:\n{feedback}\n\n"
-                        f"See detailed responses in log file or use view_results.py script."
-                    )
-                    await context.bot.send_message(chat_id=admin, text=summary_msg)
-                else:
-                    await context.bot.send_message(chat_id=admin, text=message)
-                logger.info(f"Notification sent to admin {admin}")
-            except Exception as e:
-                logger.error(f"Failed to send notification to admin {admin}: {e}")
+        if len(message) > 4000:
+            message = (
+                f"📋 Interview Evaluation\n\n"
+                f"Candidate: {display_name}\n"
+                f"Username: @{username or 'N/A'}\n"
+                f"User ID: {user_id}\n"
+                f"Decision: {decision}\n"
+                f"Score: {score}\n"
+                f"AI Assessment: {ai_note}\n\n"
+                f"Feedback:\n{feedback}\n\n"
+                f"See detailed responses in log file or use view_results.py script."
+            )
+
+        # Same text for every admin, so send to all of them concurrently
+        admins = list(admin_ids)
+        results = await asyncio.gather(
+            *(context.bot.send_message(chat_id=admin, text=message) for admin in admins),
+            return_exceptions=True,
+        )
+        for admin, result in zip(admins, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send notification to admin %s: %s", admin, result)
+            else:
+                logger.info("Notification sent to admin %s", admin)
         
         # Log to file
-        logger.info(f"COMPLETED INTERVIEW - Candidate: {display_name} (@{username or 'N/A'}, ID: {user_id}), Decision: {decision}, Score: {score}, AI Score: {ai_score}")
+        logger.info("COMPLETED INTERVIEW - Candidate: %s (@%s, ID: %s), Decision: %s, Score: %s, AI Score: %s", display_name, username or 'N/A', user_id, decision, score, ai_score)
         for q_num, q_text, r_text, r_time in responses:
-            logger.info(f"  Q{q_num+1}: {q_text} | Response: {r_text} | Time: {r_time:.1f}s")
+            logger.info("  Q%s: %s | Response: %s | Time: %.1fs", q_num+1, q_text, r_text, r_time)
     except Exception as e:
-        logger.error(f"Error in notify_admin: {e}", exc_info=True)
+        logger.error("Error in notify_admin: %s", e, exc_info=True)
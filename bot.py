@@ -4,34 +4,34 @@ Main entry point - clean and organized
 """
 
 import os
+import asyncio
+import atexit
 import sys
 import time
-import logging
+import random
 import subprocess
+import logging
+import logging.handlers
+import queue
 import signal
 from dotenv import load_dotenv
+from telegram import Update
 from telegram.ext import ApplicationBuilder, CommandHandler, MessageHandler, CallbackQueryHandler, filters
-from telegram.error import NetworkError, TimedOut, Conflict
+from telegram.error import NetworkError, TimedOut, Conflict, InvalidToken
 
 from database import init_database, close_database
 
-# Configure logging (log file in bot directory)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_PATH = os.path.join(SCRIPT_DIR, 'bot.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_PATH, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+PID_PATH = os.path.join(SCRIPT_DIR, 'bot.pid')
 
-# Load environment variables from bot directory
+# Load environment variables from bot directory (before logging, which reads LOG_LEVEL_FILE)
 ENV_PATH = os.path.join(SCRIPT_DIR, '.env')
 load_dotenv(ENV_PATH)
 
+LOG_LEVEL_FILE = os.getenv("LOG_LEVEL_FILE", "WARNING").upper()
+logger = logging.getLogger(__name__)
+
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 ADMIN_CHAT_ID = os.getenv("ADMIN_CHAT_ID")
 
@@ -40,7 +40,21 @@ if not BOT_TOKEN:
 if not ADMIN_CHAT_ID:
     raise ValueError("ADMIN_CHAT_ID not found in environment variables. Please create a .env file with ADMIN_CHAT_ID=your_chat_id")
 
-ADMIN_IDS = [int(x) for x in ADMIN_CHAT_ID.split(",")]
+ADMIN_IDS = frozenset(int(x) for x in ADMIN_CHAT_ID.split(","))
+
+# Webhook settings (leave WEBHOOK_URL unset, or set USE_POLLING=1, to poll instead)
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+PORT = int(os.getenv("PORT", "8443"))
+USE_POLLING = os.getenv("USE_POLLING", "").strip().lower() in {"1", "true", "yes"}
+
+# Only the update types the registered handlers consume
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY]
+
+# Retry policy for transient Telegram errors (Conflict, NetworkError, TimedOut)
+MAX_START_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
 
 # Import handlers AFTER ADMIN_IDS is defined to avoid import issues
 from app.handlers import (
@@ -56,12 +70,27 @@ from app.handlers import (
 # Global application instance for graceful shutdown
 app_instance = None
 
+# PID of an earlier instance found in the PID file at startup (if any)
+previous_pid = None
+
+# Set once a shutdown signal has been received
+shutdown_requested = False
+
 # Signal handler for Railway/cloud deployments
 def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info(f"Received signal {signum}, shutting down gracefully...")
-    stop_bot()
-    sys.exit(0)
+    """Handle shutdown signals gracefully.
+
+    While the application is running, only ask it to stop so run_webhook()/run_polling()
+    can unwind and main() closes the database afterwards.
+    """
+    global shutdown_requested
+    logger.info("Received signal %s, shutting down gracefully...", signum)
+    shutdown_requested = True
+    if app_instance and app_instance.running:
+        app_instance.stop_running()
+    else:
+        stop_bot()
+        sys.exit(0)
 
 
 def stop_bot():
@@ -74,86 +103,227 @@ def stop_bot():
         if app_instance:
             logger.info("Stopping Telegram bot application...")
             try:
-                # Use async shutdown if event loop is running
-                if app_instance.updater and app_instance.updater.running:
-                    app_instance.stop()
-                    # Let run_polling handle the shutdown, don't call shutdown() manually
+                # Ask the running loop to stop; run_webhook()/run_polling() handle the shutdown
+                if app_instance.running:
+                    app_instance.stop_running()
                 logger.info("Bot application stopped")
             except Exception as e:
-                logger.warning(f"Error stopping application: {e}")
+                logger.warning("Error stopping application: %s", e)
         
         close_database()
+        remove_pid_file()
         
         logger.info("Bot stopped successfully")
         return True
     except Exception as e:
-        logger.error(f"Error stopping bot: {e}", exc_info=True)
+        logger.error("Error stopping bot: %s", e, exc_info=True)
         return False
 
 
-def kill_all_bot_processes():
-    """Kill all running bot.py processes (excluding this one)."""
+def _read_pid_file():
+    """Return the PID recorded in the PID file, or None if missing/unreadable."""
     try:
-        if sys.platform == 'win32':
-            try:
-                result = subprocess.run(
-                    ['wmic', 'process', 'where', 'commandline like "%bot.py%"', 'get', 'processid'],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                
-                pids = []
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if line.isdigit():
-                        pid = int(line)
-                        if pid != os.getpid():
-                            pids.append(pid)
-                
-                for pid in pids:
-                    try:
-                        subprocess.run(['taskkill', '/F', '/PID', str(pid)], 
-                                     check=False, capture_output=True)
-                        logger.info(f"Killed bot process {pid}")
-                    except Exception as e:
-                        logger.warning(f"Could not kill process {pid}: {e}")
-            except Exception as e:
-                logger.warning(f"Error finding processes on Windows: {e}")
+        with open(PID_PATH, 'r', encoding='utf-8') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _process_command_line(pid: int):
+    """Return the command-line arguments of pid, [] if no such process is running,
+    or None if this platform offers no way to look it up."""
+    if os.path.isdir('/proc/self'):
+        try:
+            with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                return [arg.decode(errors='replace') for arg in f.read().split(b'\0') if arg]
+        except OSError:
+            return []
+
+    if sys.platform == 'win32':
+        # wmic is missing on newer Windows releases; Get-CimInstance reads the same data
+        commands = (
+            ['wmic', 'process', 'where', f'processid={pid}', 'get', 'commandline'],
+            ['powershell', '-NoProfile', '-Command',
+             f"(Get-CimInstance Win32_Process -Filter 'ProcessId={pid}').CommandLine"],
+        )
+    else:
+        commands = (['ps', '-p', str(pid), '-o', 'command='],)
+
+    for command in commands:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, check=False)
+        except OSError:
+            continue
+        lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        if command[0] == 'wmic':
+            lines = lines[1:]  # drop the "CommandLine" header
+        return lines[0].replace('"', ' ').split() if lines else []
+    return None
+
+
+def _is_bot_process(pid: int):
+    """Return True if pid is a live process running bot.py, False if it is not,
+    or None if that can't be determined on this platform.
+
+    A leftover PID file means that instance never cleaned up (crash, kill -9,
+    reboot), so its PID may since have been reused by an unrelated process.
+    """
+    args = _process_command_line(pid)
+    if args is None:
+        return None
+    return any(os.path.basename(arg) == 'bot.py' for arg in args)
+
+
+def write_pid_file():
+    """Record this process in the PID file, remembering any PID left by a previous instance."""
+    global previous_pid
+    try:
+        fd = os.open(PID_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        previous_pid = _read_pid_file()
+        if previous_pid == os.getpid() or (previous_pid is not None and _is_bot_process(previous_pid) is False):
+            logger.warning("Found stale PID file (pid=%s), taking it over", previous_pid)
+            previous_pid = None
         else:
+            logger.warning("Found PID file of another instance (pid=%s), taking it over", previous_pid)
+        fd = os.open(PID_PATH, os.O_CREAT | os.O_TRUNC | os.O_WRONLY)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(str(os.getpid()))
+    atexit.register(remove_pid_file)
+
+
+def remove_pid_file():
+    """Delete the PID file if it still belongs to this process."""
+    try:
+        if _read_pid_file() == os.getpid():
+            os.unlink(PID_PATH)
+    except OSError as e:
+        logger.warning("Could not remove PID file: %s", e)
+
+
+def kill_all_bot_processes():
+    """Kill other bot instances recorded in the PID file (excluding this one)."""
+    try:
+        own_pid = os.getpid()
+        pids = {_read_pid_file(), previous_pid} - {None, own_pid}
+        for pid in pids:
+            # Re-checked here: the PID may have exited and been reused since startup
+            is_bot = _is_bot_process(pid)
+            if is_bot is False:
+                logger.warning("Not killing process %s: not a running bot.py instance", pid)
+                continue
+            if is_bot is None:
+                logger.warning("Could not verify that process %s is a bot instance, signalling it anyway", pid)
             try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, check=False)
-                
-                for line in result.stdout.split('\n'):
-                    if 'bot.py' in line and 'grep' not in line:
-                        parts = line.split()
-                        if parts:
-                            try:
-                                pid = int(parts[1])
-                                if pid != os.getpid():
-                                    os.kill(pid, signal.SIGTERM)
-                                    logger.info(f"Killed bot process {pid}")
-                            except (ValueError, IndexError, ProcessLookupError):
-                                pass
-            except Exception as e:
-                logger.warning(f"Error finding processes on Unix: {e}")
+                os.kill(pid, signal.SIGTERM)
+                logger.info("Killed bot process %s", pid)
+            except OSError as e:
+                logger.warning("Could not kill process %s: %s", pid, e)
     except Exception as e:
-        logger.error(f"Error in kill_all_bot_processes: {e}")
+        logger.error("Error in kill_all_bot_processes: %s", e)
+
+
+def setup_logging():
+    """Configure logging: console gets INFO, bot.log only LOG_LEVEL_FILE and above
+    (WARNING by default) so routine per-message INFO lines don't hit the disk.
+
+    delay=True means bot.log is not even opened until the first record reaches it.
+    Handlers only enqueue; a listener thread does the actual console/file writes.
+    Called from main() rather than at import, since handlers import this module
+    a second time (as `bot`) when run as a script.
+    """
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(LOG_PATH, encoding='utf-8', delay=True)
+    file_handler.setLevel(LOG_LEVEL_FILE)
+    file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setLevel(logging.INFO)
+    stream_handler.setFormatter(log_formatter)
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The record is rendered again by the listener's handlers; only merge args here
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given retry attempt (0-based)."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * (1 + random.uniform(0, RETRY_JITTER))
+
+
+def run_updates(app) -> None:
+    """Receive updates via webhook when WEBHOOK_URL is configured, otherwise via polling.
+
+    close_loop=False keeps the event loop usable for a retry in main(), which
+    closes it once at the end.
+    """
+    if WEBHOOK_URL and not USE_POLLING:
+        logger.info("Starting webhook listener on port %s", PORT)
+        app.run_webhook(
+            listen="0.0.0.0",
+            port=PORT,
+            url_path=BOT_TOKEN,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{BOT_TOKEN}",
+            drop_pending_updates=True,
+            allowed_updates=ALLOWED_UPDATES,
+            close_loop=False,
+        )
+    else:
+        logger.info("Starting polling (no WEBHOOK_URL set or USE_POLLING enabled)")
+        # timeout=30 is Telegram's server-side long-poll hold, so each getUpdates
+        # round trip covers up to 30 s instead of returning immediately.
+        # bootstrap_retries=-1 makes PTB itself retry startup NetworkError/TimedOut
+        # indefinitely, so in polling mode main()'s backoff never sees those.
+        app.run_polling(
+            poll_interval=0.0,
+            timeout=30,
+            bootstrap_retries=-1,
+            drop_pending_updates=True,
+            allowed_updates=ALLOWED_UPDATES,
+            close_loop=False,
+        )
+
+
+def close_event_loop() -> None:
+    """Close the event loop run_updates() left open, if it is still open."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        # No loop was ever set (Python 3.14+ no longer creates one implicitly)
+        return
+    if not loop.is_closed():
+        loop.close()
 
 
 def main() -> None:
     """Start the bot - main entry point."""
     global app_instance
-    
+
+    setup_logging()
+
     # Register signal handlers for graceful shutdown (Railway/cloud deployments)
-    if sys.platform != 'win32':
+    if sys.platform == 'win32':
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGBREAK, signal_handler)
+    else:
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
     
+    write_pid_file()
+
     try:
         logger.info("Initializing bot...")
-        logger.info(f"Running on platform: {sys.platform}")
-        logger.info(f"Python version: {sys.version}")
+        logger.info("Running on platform: %s", sys.platform)
+        logger.info("Python version: %s", sys.version)
         
         # Initialize database
         init_database()
@@ -185,48 +355,55 @@ def main() -> None:
             logger.warning("JobQueue not available — abandonment alerts disabled")
         
         logger.info("Bot is starting...")
-        logger.info(f"Bot token: {BOT_TOKEN[:10]}...")  # Log first 10 chars for verification
+        logger.info("Bot token: %s...", BOT_TOKEN[:10])  # Log first 10 chars for verification
         
         logger.info("Press Ctrl+C to stop the bot")
         
-        # Start polling with error handling
-        # Note: run_polling() handles its own shutdown, so we don't manually stop/shutdown
+        # Start receiving updates, retrying transient Telegram errors with backoff
+        # (startup NetworkError/TimedOut only reach here in webhook mode; see run_updates)
+        # Note: run_webhook()/run_polling() handle their own shutdown, so we don't manually stop/shutdown
         try:
-            app_instance.run_polling(
-                drop_pending_updates=True,
-                allowed_updates=None  # Allow all updates
-            )
-        except KeyboardInterrupt:
-            logger.info("Received interrupt signal, shutting down...")
-            # run_polling() already handles shutdown on KeyboardInterrupt
-            close_database()
-        except Conflict as e:
-            logger.error(f"Conflict error: {e}")
-            logger.error("Another bot instance is running with the same token.")
-            logger.error("Please stop all other bot instances before starting this one.")
-            logger.info("Attempting to kill other bot processes...")
-            kill_all_bot_processes()
-            logger.info("Waiting 3 seconds before retrying...")
-            time.sleep(3)
-            logger.info("Retrying bot start...")
-            # Try one more time after killing processes
-            try:
-                app_instance.run_polling(drop_pending_updates=True)
-            except Conflict:
-                logger.error("Still conflicts after cleanup. Please manually stop all bot instances.")
-                close_database()
-                sys.exit(1)
-        except (NetworkError, TimedOut) as e:
-            logger.error(f"Network error during polling: {e}")
-            logger.error("Bot will attempt to reconnect automatically on next message.")
-            close_database()
-            sys.exit(1)
-        except Exception as e:
-            logger.error(f"Unexpected error during polling: {e}", exc_info=True)
-            close_database()
-            raise
+            for attempt in range(MAX_START_RETRIES + 1):
+                try:
+                    run_updates(app_instance)
+                    # Returns normally once stop_running() was called (signal or /stop)
+                    logger.info("Update loop finished, closing database...")
+                    close_database()
+                    return
+                except KeyboardInterrupt:
+                    logger.info("Received interrupt signal, shutting down...")
+                    # run_webhook()/run_polling() already handle shutdown on KeyboardInterrupt
+                    close_database()
+                    return
+                except InvalidToken as e:
+                    logger.error("Invalid bot token: %s", e)
+                    close_database()
+                    sys.exit(1)
+                except (Conflict, NetworkError, TimedOut) as e:
+                    if isinstance(e, Conflict):
+                        logger.error("Conflict error: %s", e)
+                        logger.error("Another bot instance is running with the same token.")
+                        logger.info("Attempting to kill other bot processes...")
+                        kill_all_bot_processes()
+                    else:
+                        logger.error("Network error while receiving updates: %s", e)
+
+                    if attempt == MAX_START_RETRIES or shutdown_requested:
+                        logger.error("Giving up after %s attempt(s). Please check the network and stop any other bot instances.", attempt + 1)
+                        close_database()
+                        sys.exit(1)
+
+                    delay = retry_delay(attempt)
+                    logger.info("Retrying bot start in %.1fs (retry %s/%s)...", delay, attempt + 1, MAX_START_RETRIES)
+                    time.sleep(delay)
+                except Exception as e:
+                    logger.error("Unexpected error while receiving updates: %s", e, exc_info=True)
+                    close_database()
+                    raise
+        finally:
+            close_event_loop()
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         close_database()
         raise
 
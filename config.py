@@ -58,8 +58,21 @@ CANDIDATES_MIGRATION_COLUMNS: List[Tuple[str, str]] = [
     ("decision", "TEXT"),
     ("feedback", "TEXT"),
     ("has_completed_interview", "INTEGER DEFAULT 0"),
+    ("selected_questions", "TEXT"),
+    ("lastname", "TEXT"),
+    ("payment_phase", "INTEGER DEFAULT 0"),
+    ("payment_method", "TEXT"),
+    ("btc_address", "TEXT"),
+    ("wise_name", "TEXT"),
+    ("wise_email", "TEXT"),
+    ("currency", "TEXT"),
+    ("abandoned_alerted", "INTEGER DEFAULT 0"),
 ]
 
+# Stored in PRAGMA user_version once the migrations above have been applied.
+# Bump it whenever CANDIDATES_MIGRATION_COLUMNS changes.
+SCHEMA_VERSION = 3
+
 # ============================================================================
 # SCRIPT LAUNCHER CONFIGURATION
 # ============================================================================
@@ -4,7 +4,7 @@ Database operations and setup
 
 import sqlite3
 import logging
-from config import DB_FILE
+from config import CANDIDATES_MIGRATION_COLUMNS, DB_FILE, SCHEMA_VERSION
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +12,28 @@ logger = logging.getLogger(__name__)
 conn = None
 cur = None
 
+# Connection tuning applied on every open: WAL turns each commit into a log append
+# instead of a full rollback-journal fsync
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
 
 def init_database():
     """Initialize database connection and create tables if needed."""
     global conn, cur
     
     conn = sqlite3.connect(str(DB_FILE), check_same_thread=False)
+    # Set before creating the cursor: handlers read columns by name
+    conn.row_factory = sqlite3.Row
     cur = conn.cursor()
+    for pragma in CONNECTION_PRAGMAS:
+        cur.execute(pragma)
     
     # Create candidates table
     cur.execute("""
@@ -38,57 +53,24 @@ def init_database():
     )
     """)
     
-    # Add new columns if they don't exist (for existing databases)
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN feedback TEXT")
-    except sqlite3.OperationalError:
-        pass
-    
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN has_completed_interview INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass
-    
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN selected_questions TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN lastname TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN payment_phase INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN payment_method TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN btc_address TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN wise_name TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN wise_email TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN currency TEXT")
-    except sqlite3.OperationalError:
-        pass
-    try:
-        cur.execute("ALTER TABLE candidates ADD COLUMN abandoned_alerted INTEGER DEFAULT 0")
-    except sqlite3.OperationalError:
-        pass
+    # Add new columns to existing databases; skipped entirely once the schema is current
+    cur.execute("PRAGMA user_version")
+    if cur.fetchone()[0] < SCHEMA_VERSION:
+        cur.execute("BEGIN")
+        cur.execute("PRAGMA table_info(candidates)")
+        existing_columns = {row[1] for row in cur.fetchall()}
+        for col_name, col_type in CANDIDATES_MIGRATION_COLUMNS:
+            if col_name not in existing_columns:
+                cur.execute(f"ALTER TABLE candidates ADD COLUMN {col_name} {col_type}")
+        # Migrate existing completed=1 records to has_completed_interview=1
+        cur.execute(
+            "UPDATE candidates SET has_completed_interview = 1 "
+            "WHERE completed = 1 AND has_completed_interview = 0"
+        )
+        cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        logger.info("Database schema migrated to version %s", SCHEMA_VERSION)
 
-    # Migrate existing completed=1 records to has_completed_interview=1
-    cur.execute("UPDATE candidates SET has_completed_interview = 1 WHERE completed = 1")
-    
     # Create responses table
     cur.execute("""
     CREATE TABLE IF NOT EXISTS responses (
@@ -102,6 +84,13 @@ def init_database():
         FOREIGN KEY (user_id) REFERENCES candidates(user_id)
     )
     """)
+
+    # Index the per-user lookups so they don't scan the whole table.
+    # (user_id, question_number) also serves the ORDER BY in report reads,
+    # and (has_completed_interview, last_time) lets the abandonment scan
+    # range-seek on the idle cutoff instead of filtering every open row.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_responses_user_qn ON responses(user_id, question_number)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_candidates_completed_time ON candidates(has_completed_interview, last_time)")
     
     conn.commit()
     logger.info("Database initialized successfully")
@@ -111,14 +100,23 @@ def clear_database():
     """Permanently clear all candidate and response data."""
     try:
         logger.warning("Purging all interview data from the database...")
+        # One write transaction for all three tables: a single commit, and no
+        # half-cleared state if the process dies midway
+        conn.commit()
+        cur.execute("BEGIN IMMEDIATE")
+        # Unqualified DELETEs take SQLite's truncate fast path; rowcount still
+        # reports how many rows went, so no COUNT(*) pass is needed for the log
         cur.execute("DELETE FROM responses")
+        responses_deleted = cur.rowcount
         cur.execute("DELETE FROM candidates")
+        candidates_deleted = cur.rowcount
         cur.execute("DELETE FROM sqlite_sequence")
         conn.commit()
 
-        logger.info("Database purged successfully")
+        logger.info("Database purged successfully (%s candidates, %s responses)", candidates_deleted, responses_deleted)
     except Exception as e:
-        logger.error(f"Error clearing database: {e}", exc_info=True)
+        conn.rollback()
+        logger.error("Error clearing database: %s", e, exc_info=True)
 
 
 def close_database():
@@ -86,7 +86,7 @@ def _update_field(api_key: str, task_id: str, field_id: str, value) -> None:
         with urllib.request.urlopen(req, timeout=30) as resp:
             response_body = resp.read().decode()
             logger.info(
-                f"ClickUp field {field_id} update HTTP {resp.status}: {response_body[:300]}"
+                "ClickUp field %s update HTTP %s: %s", field_id, resp.status, response_body[:300]
             )
             if response_body and '"err"' in response_body:
                 raise RuntimeError(f"ClickUp returned error body: {response_body}")
@@ -124,9 +124,8 @@ def push_interview_results(telegram_username: str, decision: str, score: int, re
 
     responses_preview = (responses or "")[:120].replace("\n", "\\n")
     logger.info(
-        f"ClickUp push for @{telegram_username}: task={task_id} "
-        f"decision={decision} score={score} "
-        f"responses_len={len(responses or '')} preview={responses_preview!r}"
+        "ClickUp push for @%s: task=%s decision=%s score=%s responses_len=%s preview=%r",
+        telegram_username, task_id, decision, score, len(responses or ''), responses_preview,
     )
 
     updates = [
@@ -138,10 +137,10 @@ def push_interview_results(telegram_username: str, decision: str, score: int, re
     for label, field_id, value in updates:
         try:
             _update_field(api_key, task_id, field_id, value)
-            logger.info(f"ClickUp {label} updated for @{telegram_username}")
+            logger.info("ClickUp %s updated for @%s", label, telegram_username)
         except Exception:
             logger.exception(
-                f"ClickUp {label} update FAILED for @{telegram_username} (task {task_id})"
+                "ClickUp %s update FAILED for @%s (task %s)", label, telegram_username, task_id
             )
             failures.append(label)
 
@@ -150,4 +149,4 @@ def push_interview_results(telegram_username: str, decision: str, score: int, re
             f"ClickUp push partially failed for @{telegram_username}: {failures}"
         )
 
-    logger.info(f"ClickUp task {task_id} updated for @{telegram_username}: {decision}, score={score}")
+    logger.info("ClickUp task %s updated for @%s: %s, score=%s", task_id, telegram_username, decision, score)